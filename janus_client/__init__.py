@@ -11,7 +11,15 @@ from .transport import JanusTransport
 from .transport_http import JanusTransportHTTP
 from .transport_websocket import JanusTransportWebsocket
 
+try:
+    # Optional, needs picows
+    from .transport_picows import JanusTransportPicows
+except ImportError:
+    pass
+
 from .media import MediaKind, MediaStreamTrack, MediaPlayer
 
+from .event_loop import install_uvloop
+
 import logging
 logging.getLogger("janus_client").addHandler(logging.NullHandler())
@@ -1,14 +1,88 @@
+import asyncio
+import copy
+import functools
+import itertools
 import uuid
-from typing import Dict, Union, List
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    NamedTuple,
+    Union,
+    List,
+    Tuple,
+)
 import logging
 
-from .transport import JanusTransport
+from .transport import JanusTransport, json_dumps
 from .transport_http import JanusTransportHTTP
-from .message_transaction import is_subset
+from .message_transaction import CompiledMatcher
 
 
 logger = logging.getLogger(__name__)
 
+# Requests that don't change anything on Janus
+_READ_REQUESTS = frozenset({"ping", "info", "loops_info", "get_status", "list_tokens"})
+
+# Any request can be answered by an error
+_ERROR_MATCHER = CompiledMatcher(
+    {
+        "janus": "error",
+        "error": {
+            "code": None,
+            "reason": None,
+        },
+    }
+)
+_PONG_MATCHER = CompiledMatcher({"janus": "pong"})
+_SERVER_INFO_MATCHER = CompiledMatcher({"janus": "server_info"})
+_SUCCESS_MATCHER = CompiledMatcher({"janus": "success"})
+_STATUS_MATCHER = CompiledMatcher({"janus": "success", "status": {}})
+_TOKENS_MATCHER = CompiledMatcher({"janus": "success", "data": {"tokens": None}})
+_PLUGINS_MATCHER = CompiledMatcher({"janus": "success", "data": {"plugins": None}})
+
+
+class _Setter(NamedTuple):
+    request: str
+    field: str
+    response_field: str
+    matcher: CompiledMatcher
+
+    def message(self, value: Any) -> dict:
+        return {"janus": self.request, self.field: value}
+
+
+def _setter(request: str, field: str, response_field: str) -> _Setter:
+    return _Setter(
+        request=request,
+        field=field,
+        response_field=response_field,
+        matcher=CompiledMatcher({"janus": "success", response_field: None}),
+    )
+
+
+# Settings that can be changed at runtime, keyed by their name in get_settings
+_SETTERS = {
+    "session_timeout": _setter("set_session_timeout", "timeout", "timeout"),
+    "log_level": _setter("set_log_level", "level", "level"),
+    "log_timestamps": _setter("set_log_timestamps", "timestamps", "log_timestamps"),
+    "log_colors": _setter("set_log_colors", "colors", "log_colors"),
+    "locking_debug": _setter("set_locking_debug", "debug", "locking_debug"),
+    "refcount_debug": _setter("set_refcount_debug", "debug", "refcount_debug"),
+    "libnice_debug": _setter("set_libnice_debug", "debug", "libnice_debug"),
+    "min_nack_queue": _setter("set_min_nack_queue", "min_nack_queue", "min_nack_queue"),
+    "no_media_timer": _setter("set_no_media_timer", "no_media_timer", "no_media_timer"),
+    "slowlink_threshold": _setter(
+        "set_slowlink_threshold", "slowlink_threshold", "slowlink_threshold"
+    ),
+}
+
+
+def _match(matcher: CompiledMatcher, message: dict) -> bool:
+    return matcher(message) or _ERROR_MATCHER(message)
+
 
 """
 # Take note to enable admin API with websockets in Janus, for example:
@@ -38,8 +112,14 @@ class JanusAdminMonitorClient:
     An Admin/Monitor API that can be used to ask Janus for more specific information related to sessions and handles.
     """
 
-    __transport: JanusTransport
+    __transports: List[JanusTransport]
+    __next_transport: Iterator[JanusTransport]
     __admin_secret: str
+    __cache_ttl: float
+    __cache: Dict[str, Tuple[float, Any]]
+    __write_generation: int
+    __inflight: asyncio.Semaphore
+    __pending_reads: Dict[Tuple, asyncio.Future]
 
     def __init__(
         self,
@@ -47,72 +127,224 @@ class JanusAdminMonitorClient:
         admin_secret: str,
         api_secret: str = None,
         token: str = None,
+        admin_cache_ttl: float = 1,
+        admin_max_inflight: int = 32,
+        transport_config: Dict = None,
+        admin_connections: int = 1,
     ):
-        self.__transport = JanusTransport.create_transport(
-            base_url=base_url,
-            api_secret=api_secret,
-            token=token,
-            config={"subprotocol": "janus-admin-protocol"},
-        )
+        """Create Admin/Monitor client
+
+        :param admin_cache_ttl: (optional) Seconds to reuse the result of info, loops_info,
+            get_settings and list_tokens before asking Janus again.
+            Set to 0 to disable caching.
+        :param admin_max_inflight: (optional) Maximum number of admin requests
+            waiting for a response at the same time. Concurrent requests
+            beyond this wait for a free slot before being sent, the wait
+            counts towards their timeout.
+        :param transport_config: (optional) Extra config for
+            JanusTransport.create_transport, e.g. {"engine": "picows"}.
+        :param admin_connections: (optional) Number of connections to Janus.
+            Requests are spread over them in turn, so a slow request on one
+            connection doesn't hold up requests on the others.
+        """
+
+        if admin_max_inflight < 1:
+            raise ValueError("admin_max_inflight must be at least 1")
+        if admin_connections < 1:
+            raise ValueError("admin_connections must be at least 1")
+
+        self.__transports = [
+            JanusTransport.create_transport(
+                base_url=base_url,
+                api_secret=api_secret,
+                token=token,
+                config={
+                    "subprotocol": "janus-admin-protocol",
+                    **(transport_config or {}),
+                },
+            )
+            for _ in range(admin_connections)
+        ]
+        self.__next_transport = itertools.cycle(self.__transports)
         self.__admin_secret = admin_secret
+        self.__cache_ttl = admin_cache_ttl
+        self.__cache = dict()
+        self.__write_generation = 0
+        self.__inflight = asyncio.Semaphore(admin_max_inflight)
+        self.__pending_reads = dict()
 
     def __str__(self):
-        return f"Admin/Monitor ({self.__transport.base_url}) {self}"
+        return f"Admin/Monitor ({self.__transports[0].base_url}) {self}"
 
     async def connect(self) -> None:
         """Initialize resources"""
 
-        await self.__transport.connect()
+        await asyncio.gather(*[transport.connect() for transport in self.__transports])
 
     async def disconnect(self) -> None:
         """Release resources"""
 
-        await self.__transport.disconnect()
+        await asyncio.gather(
+            *[transport.disconnect() for transport in self.__transports]
+        )
+
+    async def __cached(self, key: str, coro_factory: Callable[[], Awaitable]) -> Any:
+        """Return the result of coro_factory, reusing it for admin_cache_ttl seconds
+
+        Callers always get their own copy, so changing it doesn't change what
+        later callers get.
+        """
+
+        loop = asyncio.get_running_loop()
+
+        if key in self.__cache:
+            expiry, value = self.__cache[key]
+            if loop.time() < expiry:
+                return copy.deepcopy(value)
+
+        write_generation = self.__write_generation
+        value = await coro_factory()
+
+        # Don't store it if a write finished while waiting, it may be stale
+        if self.__cache_ttl > 0 and write_generation == self.__write_generation:
+            self.__cache[key] = (loop.time() + self.__cache_ttl, copy.deepcopy(value))
+
+        return value
 
     async def send_wrapper(
         self,
         message: dict,
-        matcher: dict = {},
-        jsep: dict = {},
+        matcher: Union[dict, CompiledMatcher, None] = None,
+        jsep: Union[dict, None] = None,
         timeout: Union[float, None] = 15,
         authorize: bool = True,
     ) -> dict:
-        def function_matcher(message: dict):
-            return is_subset(message, matcher) or is_subset(
-                message,
-                {
-                    "janus": "error",
-                    "error": {
-                        "code": None,
-                        "reason": None,
-                    },
-                },
+        if not isinstance(matcher, CompiledMatcher):
+            matcher = CompiledMatcher(matcher if matcher is not None else {})
+
+        # The transport reports a missing "janus" field
+        if message.get("janus") not in _READ_REQUESTS:
+            try:
+                return await self.__send(
+                    message=message,
+                    matcher=matcher,
+                    jsep=jsep,
+                    timeout=timeout,
+                    authorize=authorize,
+                )
+            finally:
+                # Cached results may be stale after any request that changes
+                # something. Also when it failed or timed out, Janus may have
+                # applied it anyway.
+                self.__write_generation += 1
+                self.__cache.clear()
+
+        # Identical reads that are still waiting for a response share it.
+        # Not across writes, a read sent after a write must see it.
+        key = (
+            json_dumps([message, jsep]),
+            id(matcher),
+            authorize,
+            timeout,
+            self.__write_generation,
+        )
+        request = self.__pending_reads.get(key)
+        if request is None:
+            request = asyncio.ensure_future(
+                self.__send(
+                    message=message,
+                    matcher=matcher,
+                    jsep=jsep,
+                    timeout=timeout,
+                    authorize=authorize,
+                )
             )
+            request.add_done_callback(functools.partial(self.__read_done, key))
+            self.__pending_reads[key] = request
 
-        full_message = message
-        if jsep:
-            full_message = {**message, "jsep": jsep}
+            # Shield so that one cancelled caller doesn't cancel it for the others
+            return await asyncio.shield(request)
+
+        # Joined another caller's request, get a copy of its response
+        return copy.deepcopy(await asyncio.shield(request))
+
+    def __read_done(self, key: Tuple, request: asyncio.Future) -> None:
+        self.__pending_reads.pop(key, None)
+
+        # Retrieve the exception, all callers may have been cancelled
+        if not request.cancelled():
+            request.exception()
+
+    async def __send(
+        self,
+        message: dict,
+        matcher: CompiledMatcher,
+        jsep: Union[dict, None],
+        timeout: Union[float, None],
+        authorize: bool,
+    ) -> dict:
+        # Work on a copy, the caller's message must not get the admin secret
+        # or the transaction ID that the transport adds
+        full_message = message.copy()
+        if jsep is not None:
+            full_message["jsep"] = jsep
 
         if authorize:
             full_message["admin_secret"] = self.__admin_secret
 
-        message_transaction = await self.__transport.send(
-            message=full_message,
-        )
-        response = await message_transaction.get(
-            matcher=function_matcher,
-            timeout=timeout,
-        )
-        await message_transaction.done()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        if self.__inflight.locked():
+            await asyncio.wait_for(self.__inflight.acquire(), timeout)
+        else:
+            # Free slot, skip the task and timer that wait_for creates
+            await self.__inflight.acquire()
+        try:
+            message_transaction = await next(self.__next_transport).send(
+                message=full_message,
+            )
+            try:
+                return await message_transaction.get(
+                    matcher=functools.partial(_match, matcher),
+                    timeout=None if deadline is None else deadline - loop.time(),
+                )
+            finally:
+                # Release the transaction even if the request timed out
+                await message_transaction.done()
+        finally:
+            self.__inflight.release()
+
+    async def send_many(
+        self,
+        calls: List[Tuple[dict, Union[dict, CompiledMatcher]]],
+        timeout: Union[float, None] = 15,
+    ) -> List[dict]:
+        """
+        Send several admin requests concurrently.
 
-        return response
+        All requests are put on the wire before any response is awaited, so
+        the whole batch completes in about one round-trip instead of one
+        round-trip per request.
+
+        :param calls: List of (message, matcher) tuples, same as send_wrapper.
+
+        :returns: Responses in the same order as calls.
+        """
+
+        return await asyncio.gather(
+            *[
+                self.send_wrapper(message=message, matcher=matcher, timeout=timeout)
+                for message, matcher in calls
+            ]
+        )
 
     async def ping(self) -> Dict:
         """A simple ping/pong mechanism with server. Doesn't require admin secret."""
 
         return await self.send_wrapper(
             message={"janus": "ping"},
-            matcher={"janus": "pong"},
+            matcher=_PONG_MATCHER,
             authorize=False,
         )
 
@@ -122,12 +354,17 @@ class JanusAdminMonitorClient:
         Doesn't require admin secret.
         """
 
-        if isinstance(self.__transport, JanusTransportHTTP):
-            return await self.__transport.info()
+        return await self.__cached("info", lambda: self.__info())
+
+    async def __info(self) -> Dict:
+        # All transports are of the same class
+        transport = self.__transports[0]
+        if isinstance(transport, JanusTransportHTTP):
+            return await transport.info()
         else:
             return await self.send_wrapper(
                 message={"janus": "info"},
-                matcher={"janus": "server_info"},
+                matcher=_SERVER_INFO_MATCHER,
                 authorize=False,
             )
 
@@ -138,8 +375,11 @@ class JanusAdminMonitorClient:
         in use (returns an empty array otherwise).
         """
 
+        return await self.__cached("loops_info", lambda: self.__loops_info())
+
+    async def __loops_info(self) -> List:
         response = await self.send_wrapper(
-            message={"janus": "loops_info"}, matcher={"janus": "success"}
+            message={"janus": "loops_info"}, matcher=_SUCCESS_MATCHER
         )
         return response["loops"]
 
@@ -151,23 +391,57 @@ class JanusAdminMonitorClient:
         runtime via the Admin API.
         """
 
+        return await self.__cached("get_settings", lambda: self.__get_settings())
+
+    async def __get_settings(self) -> Dict:
         response = await self.send_wrapper(
             message={"janus": "get_status"},
-            matcher={"janus": "success", "status": {}},
+            matcher=_STATUS_MATCHER,
         )
         return response["status"]
 
+    async def __set(self, setting: str, value: Any) -> Any:
+        setter = _SETTERS[setting]
+        response = await self.send_wrapper(
+            message=setter.message(value),
+            matcher=setter.matcher,
+        )
+        return response[setter.response_field]
+
+    async def set_settings(self, **settings: Any) -> Dict:
+        """
+        Change several settings at once, for example
+        ``await admin_client.set_settings(log_level=4, log_colors=False)``.
+        Setting names are the same as in get_settings.
+
+        All requests are sent concurrently and Janus handles each of them
+        independently, so don't rely on the order they are applied in.
+        Returns the values that they are set to.
+        """
+
+        unknown_settings = settings.keys() - _SETTERS.keys()
+        if unknown_settings:
+            raise TypeError(f"Unknown settings: {sorted(unknown_settings)}")
+
+        setters = [_SETTERS[setting] for setting in settings]
+        responses = await self.send_many(
+            [
+                (setter.message(value), setter.matcher)
+                for setter, value in zip(setters, settings.values())
+            ]
+        )
+        return {
+            setting: response[setter.response_field]
+            for setting, setter, response in zip(settings, setters, responses)
+        }
+
     async def set_session_timeout(self, session_timeout: int) -> int:
         """
         Change global session timeout value in Janus.
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_session_timeout", "timeout": session_timeout},
-            matcher={"janus": "success", "timeout": None},
-        )
-        return response["timeout"]
+        return await self.__set("session_timeout", session_timeout)
 
     async def set_log_level(self, log_level: int) -> int:
         """
@@ -175,11 +449,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_log_level", "level": log_level},
-            matcher={"janus": "success", "level": None},
-        )
-        return response["level"]
+        return await self.__set("log_level", log_level)
 
     async def set_log_timestamps(self, log_timestamps: bool) -> bool:
         """
@@ -188,11 +458,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_log_timestamps", "timestamps": log_timestamps},
-            matcher={"janus": "success", "log_timestamps": None},
-        )
-        return response["log_timestamps"]
+        return await self.__set("log_timestamps", log_timestamps)
 
     async def set_log_colors(self, log_colors: bool) -> bool:
         """
@@ -201,11 +467,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_log_colors", "colors": log_colors},
-            matcher={"janus": "success", "log_colors": None},
-        )
-        return response["log_colors"]
+        return await self.__set("log_colors", log_colors)
 
     async def set_locking_debug(self, locking_debug: bool) -> bool:
         """
@@ -215,11 +477,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_locking_debug", "debug": locking_debug},
-            matcher={"janus": "success", "locking_debug": None},
-        )
-        return response["locking_debug"]
+        return await self.__set("locking_debug", locking_debug)
 
     async def set_refcount_debug(self, refcount_debug: bool) -> bool:
         """
@@ -229,11 +487,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_refcount_debug", "debug": refcount_debug},
-            matcher={"janus": "success", "refcount_debug": None},
-        )
-        return response["refcount_debug"]
+        return await self.__set("refcount_debug", refcount_debug)
 
     async def set_libnice_debug(self, libnice_debug: bool) -> bool:
         """
@@ -241,11 +495,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_libnice_debug", "debug": libnice_debug},
-            matcher={"janus": "success", "libnice_debug": None},
-        )
-        return response["libnice_debug"]
+        return await self.__set("libnice_debug", libnice_debug)
 
     async def set_min_nack_queue(self, min_nack_queue: int) -> int:
         """
@@ -253,11 +503,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_min_nack_queue", "min_nack_queue": min_nack_queue},
-            matcher={"janus": "success", "min_nack_queue": None},
-        )
-        return response["min_nack_queue"]
+        return await self.__set("min_nack_queue", min_nack_queue)
 
     async def set_no_media_timer(self, no_media_timer: int) -> int:
         """
@@ -265,11 +511,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={"janus": "set_no_media_timer", "no_media_timer": no_media_timer},
-            matcher={"janus": "success", "no_media_timer": None},
-        )
-        return response["no_media_timer"]
+        return await self.__set("no_media_timer", no_media_timer)
 
     async def set_slowlink_threshold(self, slowlink_threshold: int) -> int:
         """
@@ -277,14 +519,7 @@ class JanusAdminMonitorClient:
         Returns the value that it is set to.
         """
 
-        response = await self.send_wrapper(
-            message={
-                "janus": "set_slowlink_threshold",
-                "slowlink_threshold": slowlink_threshold,
-            },
-            matcher={"janus": "success", "slowlink_threshold": None},
-        )
-        return response["slowlink_threshold"]
+        return await self.__set("slowlink_threshold", slowlink_threshold)
 
     # Token related requests
 
@@ -294,13 +529,18 @@ class JanusAdminMonitorClient:
         (only available if you enabled the Stored token based authentication mechanism);
         """
 
+        return await self.__cached("list_tokens", lambda: self.__list_tokens())
+
+    async def __list_tokens(self) -> List:
         response = await self.send_wrapper(
             message={"janus": "list_tokens"},
-            matcher={"janus": "success", "data": {"tokens": None}},
+            matcher=_TOKENS_MATCHER,
         )
         return response["data"]["tokens"]
 
-    async def add_token(self, token: str = uuid.uuid4().hex, plugins: list = []) -> str:
+    async def add_token(
+        self, token: Union[str, None] = None, plugins: Union[list, None] = None
+    ) -> str:
         """
         Add a valid token
         (only available if you enabled the Stored token based authentication mechanism)
@@ -308,19 +548,22 @@ class JanusAdminMonitorClient:
         Ok to add the same token repeatedly.
         Plugin permissions provided in input will be added to existing permissions.
         Providing empty plugin permissions will allow access to all plugins.
+        A random token is generated if none is provided.
         """
 
-        success_matcher = {"janus": "success", "data": {"plugins": None}}
+        token = token or uuid.uuid4().hex
+
+        message = {"janus": "add_token", "token": token}
+        if plugins:
+            message["plugins"] = plugins
+
+        success_matcher = _PLUGINS_MATCHER
         response = await self.send_wrapper(
-            message={
-                "janus": "add_token",
-                "token": token,
-                "plugins": plugins,
-            },
+            message=message,
             matcher=success_matcher,
         )
 
-        if not is_subset(response, success_matcher):
+        if not success_matcher(response):
             raise Exception("Fail to add token")
 
         return token
@@ -333,7 +576,7 @@ class JanusAdminMonitorClient:
         Will fail if the token is not already added.
         """
 
-        success_matcher = {"janus": "success"}
+        success_matcher = _SUCCESS_MATCHER
         response = await self.send_wrapper(
             message={
                 "janus": "remove_token",
@@ -342,7 +585,7 @@ class JanusAdminMonitorClient:
             matcher=success_matcher,
         )
 
-        if not is_subset(response, success_matcher):
+        if not success_matcher(response):
             raise Exception("Fail to remove token")
 
         return True
@@ -361,7 +604,7 @@ class JanusAdminMonitorClient:
         if not plugins:
             raise Exception("plugins should be non-empty array")
 
-        success_matcher = {"janus": "success", "data": {"plugins": None}}
+        success_matcher = _PLUGINS_MATCHER
         response = await self.send_wrapper(
             message={
                 "janus": "allow_token",
@@ -371,7 +614,7 @@ class JanusAdminMonitorClient:
             matcher=success_matcher,
         )
 
-        if not is_subset(response, success_matcher):
+        if not success_matcher(response):
             raise Exception("Fail to allow token")
 
         return response["data"]["plugins"]
@@ -390,7 +633,7 @@ class JanusAdminMonitorClient:
         if not plugins:
             raise Exception("plugins should be non-empty array")
 
-        success_matcher = {"janus": "success", "data": {"plugins": None}}
+        success_matcher = _PLUGINS_MATCHER
         response = await self.send_wrapper(
             message={
                 "janus": "disallow_token",
@@ -400,7 +643,7 @@ class JanusAdminMonitorClient:
             matcher=success_matcher,
         )
 
-        if not is_subset(response, success_matcher):
+        if not success_matcher(response):
             raise Exception("Fail to disallow token")
 
         return response["data"]["plugins"]
@@ -0,0 +1,24 @@
+import asyncio
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+def install_uvloop() -> bool:
+    """Use uvloop for new event loops if it's installed
+
+    Must be called before the event loop is created, e.g. before asyncio.run().
+    An event loop that is already running is not changed.
+
+    :returns: True if uvloop will be used
+    """
+
+    try:
+        import uvloop
+    except ImportError:
+        logger.info("uvloop is not installed, using the default event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
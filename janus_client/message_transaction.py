@@ -1,6 +1,6 @@
 import asyncio
 import uuid
-from typing import Dict, List, Union, Callable
+from typing import Any, Dict, List, Tuple, Union, Callable
 
 
 def is_subset(dict_1: Dict, dict_2: Dict) -> bool:
@@ -49,6 +49,63 @@ def is_subset(dict_1: Dict, dict_2: Dict) -> bool:
     return True
 
 
+# Kinds of check done by CompiledMatcher
+_CHECK_PRESENT = 0
+_CHECK_EQUAL = 1
+_CHECK_DICT = 2
+
+
+class CompiledMatcher:
+    """Dictionary matcher flattened into a list of (path, check, value)
+
+    Matches the same messages as is_subset(message, matcher), but the
+    matcher is only walked once when it's compiled instead of on every
+    message. Compile matchers that are used repeatedly and keep them around.
+    """
+
+    __checks: List[Tuple[Tuple, int, Any]]
+
+    def __init__(self, matcher: Dict) -> None:
+        if not isinstance(matcher, dict):
+            raise TypeError(f"matcher must be a dictionary: {matcher}")
+
+        self.__checks = []
+        self.__compile(matcher=matcher, path=())
+
+    def __compile(self, matcher: Dict, path: Tuple) -> None:
+        for key, value in matcher.items():
+            key_path = path + (key,)
+
+            if isinstance(value, dict):
+                if value:
+                    self.__compile(matcher=value, path=key_path)
+                else:
+                    # Empty dict only needs a dict value
+                    self.__checks.append((key_path, _CHECK_DICT, None))
+            elif isinstance(value, (str, int)):
+                self.__checks.append((key_path, _CHECK_EQUAL, value))
+            else:
+                # Other types only need the key to be present
+                self.__checks.append((key_path, _CHECK_PRESENT, None))
+
+    def __call__(self, message: Dict) -> bool:
+        for path, check, expected in self.__checks:
+            value = message
+            for key in path:
+                if not isinstance(value, dict) or key not in value:
+                    return False
+                value = value[key]
+
+            if check == _CHECK_EQUAL:
+                if value != expected:
+                    return False
+            elif check == _CHECK_DICT:
+                if not isinstance(value, dict):
+                    return False
+
+        return True
+
+
 class MessageTransaction:
     __id: str
     __msg_all: List[Dict]
@@ -81,26 +138,25 @@ class MessageTransaction:
             _matcher = matcher
         else:
             # matcher is a dict
-            def dict_matcher(msg: dict) -> bool:
-                return is_subset(msg, matcher)
-
-            _matcher = dict_matcher
+            _matcher = CompiledMatcher(matcher)
 
         # Try to find message in saved messages
         for msg in self.__msg_all:
             if _matcher(msg):
                 return msg
 
-        # Wait in queue until a matching message is found
-        msg = await asyncio.wait_for(self.__msg_in.get(), timeout=timeout)
-        # Always save received messages
-        self.__msg_all.append(msg)
+        # Wait in queue until a matching message is found.
+        # The timeout covers the whole wait, not each received message.
+        return await asyncio.wait_for(self.__wait_for_match(_matcher), timeout=timeout)
 
-        while not _matcher(msg):
-            msg = await asyncio.wait_for(self.__msg_in.get(), timeout=timeout)
+    async def __wait_for_match(self, matcher: Callable) -> Dict:
+        while True:
+            msg = await self.__msg_in.get()
+            # Always save received messages
             self.__msg_all.append(msg)
 
-        return msg
+            if matcher(msg):
+                return msg
 
     async def on_done(self) -> None:
         pass
@@ -9,10 +9,24 @@ from aiortc import (
 from aiortc.contrib.media import MediaPlayer, MediaRecorder
 
 from .plugin_base import JanusPlugin
-from .message_transaction import is_subset
+from .message_transaction import is_subset, CompiledMatcher
 
 logger = logging.getLogger(__name__)
 
+_ERROR_MATCHER = CompiledMatcher(
+    {
+        "janus": "event",
+        "plugindata": {
+            "plugin": "janus.plugin.videocall",
+            "data": {
+                "videocall": "event",
+                "error_code": None,
+                "error": None,
+            },
+        },
+    }
+)
+
 
 class JanusVideoCallPlugin(JanusPlugin):
     """Janus Video Call plugin implementation"""
@@ -116,26 +130,18 @@ class JanusVideoCallPlugin(JanusPlugin):
         # }
         # await self.accept(jsep=jsep)
 
-    async def send_wrapper(self, message: dict, matcher: dict, jsep: dict = {}) -> dict:
+    async def send_wrapper(
+        self, message: dict, matcher: dict, jsep: dict = None
+    ) -> dict:
+        compiled_matcher = CompiledMatcher(matcher)
+
         def function_matcher(message: dict):
-            return is_subset(message, matcher) or is_subset(
-                message,
-                {
-                    "janus": "event",
-                    "plugindata": {
-                        "plugin": "janus.plugin.videocall",
-                        "data": {
-                            "videocall": "event",
-                            "error_code": None,
-                            "error": None,
-                        },
-                    },
-                },
-            )
+            return compiled_matcher(message) or _ERROR_MATCHER(message)
 
         full_message = message
         if jsep:
-            full_message = {**message, "jsep": jsep}
+            full_message = message.copy()
+            full_message["jsep"] = jsep
 
         message_transaction = await self.send(
             message=full_message,
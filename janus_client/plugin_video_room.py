@@ -1,6 +1,7 @@
 import logging
+import functools
 from enum import Enum
-from typing import List
+from typing import List, Tuple
 
 from aiortc import (
     RTCPeerConnection,
@@ -9,10 +10,38 @@ from aiortc import (
 )
 
 from .plugin_base import JanusPlugin
-from .message_transaction import is_subset
+from .message_transaction import is_subset, CompiledMatcher
 
 logger = logging.getLogger(__name__)
 
+_ERROR_MATCHER = CompiledMatcher({"janus": "error", "error": {}})
+
+
+def _plugin_error_matcher(janus: str, plugin_name: str) -> CompiledMatcher:
+    return CompiledMatcher(
+        {
+            "janus": janus,
+            "plugindata": {
+                "plugin": plugin_name,
+                "data": {
+                    "videoroom": "event",
+                    "error_code": None,
+                    "error": None,
+                },
+            },
+        }
+    )
+
+
+@functools.lru_cache()
+def _error_matchers(plugin_name: str) -> Tuple[CompiledMatcher, ...]:
+    """All the ways VideoRoom can answer with an error, compiled once"""
+    return (
+        _plugin_error_matcher("success", plugin_name),
+        _plugin_error_matcher("event", plugin_name),
+        _ERROR_MATCHER,
+    )
+
 
 class AllowedAction(Enum):
     ENABLE = "enable"
@@ -95,44 +124,21 @@ class JanusVideoRoomPlugin(JanusPlugin):
 
         # VideoRoom plugin doesn't send JSEP asynchronously
 
-    async def send_wrapper(self, message: dict, matcher: dict, jsep: dict = {}) -> dict:
+    async def send_wrapper(
+        self, message: dict, matcher: dict, jsep: dict = None
+    ) -> dict:
+        matchers = (CompiledMatcher(matcher),) + _error_matchers(self.name)
+
         def function_matcher(message: dict):
-            return (
-                is_subset(message, matcher)
-                or is_subset(
-                    message,
-                    {
-                        "janus": "success",
-                        "plugindata": {
-                            "plugin": self.name,
-                            "data": {
-                                "videoroom": "event",
-                                "error_code": None,
-                                "error": None,
-                            },
-                        },
-                    },
-                )
-                or is_subset(
-                    message,
-                    {
-                        "janus": "event",
-                        "plugindata": {
-                            "plugin": self.name,
-                            "data": {
-                                "videoroom": "event",
-                                "error_code": None,
-                                "error": None,
-                            },
-                        },
-                    },
-                )
-                or is_subset(message, {"janus": "error", "error": {}})
-            )
+            for _matcher in matchers:
+                if _matcher(message):
+                    return True
+            return False
 
         full_message = message
         if jsep:
-            full_message = {**message, "jsep": jsep}
+            full_message = message.copy()
+            full_message["jsep"] = jsep
 
         message_transaction = await self.send(
             message=full_message,
@@ -140,7 +146,7 @@ class JanusVideoRoomPlugin(JanusPlugin):
         response = await message_transaction.get(matcher=function_matcher, timeout=15)
         await message_transaction.done()
 
-        if is_subset(response, {"janus": "error", "error": {}}):
+        if _ERROR_MATCHER(response):
             raise Exception(f"Janus error: {response}")
 
         return response
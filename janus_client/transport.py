@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import asyncio
-from typing import TYPE_CHECKING, List, Dict
+from typing import TYPE_CHECKING, Any, List, Dict, Union
 import logging
 
 # import uuid
@@ -13,6 +13,35 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Use orjson if it's installed, it's much faster than the standard json module
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_dumps_bytes = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+    def json_dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+# Messages bigger than this are decoded in a thread to not block the event loop
+LARGE_MESSAGE_SIZE = 64 * 1024
+
+
+async def json_loads_async(message_raw: Union[str, bytes]) -> Any:
+    """Decode a received message, in a thread if it's bigger than LARGE_MESSAGE_SIZE"""
+
+    if len(message_raw) > LARGE_MESSAGE_SIZE:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, json_loads, message_raw)
+
+    return json_loads(message_raw)
+
 
 class JanusTransport(ABC):
     """Janus transport protocol interface
@@ -30,6 +59,9 @@ class JanusTransport(ABC):
     __connect_lock: asyncio.Lock
     connected: bool
     """Must set this property when connected or disconnected"""
+    engine: str = None
+    """Set this to let users pick this transport with config={"engine": ...}
+    when another transport handles the same base_url"""
 
     @abstractmethod
     async def _send(self, message: Dict) -> None:
@@ -163,8 +195,8 @@ class JanusTransport(ABC):
             message["handle_id"] = handle_id
 
         # Send the message
-        message_json = json.dumps(message)
-        logger.info(f"Send: {message_json}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Send: {json_dumps(message)}")
         await self._send(message=message)
 
         return message_transaction
@@ -254,6 +286,8 @@ class JanusTransport(ABC):
             api_secret (str, optional): _description_. Defaults to None.
             token (str, optional): _description_. Defaults to None.
             config (Dict, optional): _description_. Defaults to {}.
+                Set "engine" to pick a transport class with the same engine,
+                e.g. {"engine": "picows"}.
 
         Raises:
             Exception: No transport class found
@@ -264,9 +298,13 @@ class JanusTransport(ABC):
         """
         # Get matching results
         matching_results = []
+        engine = config.get("engine")
         for transport_implementation in JanusTransport.__transport_implementation:
-            protocol_matcher = transport_implementation[0]
-            matching_results.append(protocol_matcher(base_url))
+            protocol_matcher, transport_cls = transport_implementation
+            matching_results.append(
+                protocol_matcher(base_url)
+                and getattr(transport_cls, "engine", None) == engine
+            )
 
         total_matched = sum(map(bool, matching_results))
 
@@ -5,7 +5,7 @@ from typing import Dict
 
 import aiohttp
 
-from .transport import JanusTransport
+from .transport import JanusTransport, json_dumps, json_loads
 
 
 logger = logging.getLogger(__name__)
@@ -54,7 +54,7 @@ class JanusTransportHTTP(JanusTransport):
     async def info(self) -> Dict:
         async with aiohttp.ClientSession() as http_session:
             async with http_session.get(f"{self.base_url}/info") as response:
-                return await response.json()
+                return await response.json(loads=json_loads)
 
     async def _send(
         self,
@@ -63,14 +63,14 @@ class JanusTransportHTTP(JanusTransport):
         session_id = message.get("session_id")
         handle_id = message.get("handle_id")
 
-        async with aiohttp.ClientSession() as http_session:
+        async with aiohttp.ClientSession(json_serialize=json_dumps) as http_session:
             async with http_session.post(
                 url=self.__build_url(session_id=session_id, handle_id=handle_id),
                 json=message,
             ) as response:
                 response.raise_for_status()
 
-                response_dict = await response.json()
+                response_dict = await response.json(loads=json_loads)
 
                 # if "error" in response_dict:
                 #     raise Exception(response_dict)
@@ -120,7 +120,7 @@ class JanusTransportHTTP(JanusTransport):
 
                     response.raise_for_status()
 
-                    response_dict = await response.json()
+                    response_dict = await response.json(loads=json_loads)
 
                     if "error" in response_dict:
                         raise Exception(response_dict)
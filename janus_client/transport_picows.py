@@ -0,0 +1,157 @@
+import logging
+import asyncio
+import traceback
+from typing import List, Union
+
+from picows import WSCloseCode, WSFrame, WSListener, WSMsgType, WSTransport, ws_connect
+
+from .transport import JanusTransport, json_dumps_bytes, json_loads_async
+
+
+logger = logging.getLogger(__name__)
+
+
+class JanusPicowsListener(WSListener):
+    """Collect complete text messages from picows into a queue
+
+    picows calls these callbacks synchronously from the event loop,
+    so messages are only queued here and handled by the transport.
+    """
+
+    __messages: asyncio.Queue
+    __fragments: List[bytes]
+    __msg_type: WSMsgType
+
+    def __init__(self, messages: asyncio.Queue):
+        self.__messages = messages
+        self.__fragments = []
+        self.__msg_type = None
+
+    def on_ws_frame(self, transport: WSTransport, frame: WSFrame) -> None:
+        # Continuation frames belong to the message started by the last
+        # TEXT or BINARY frame. Janus only sends text, binary is dropped.
+        msg_type = frame.msg_type
+        if msg_type == WSMsgType.CONTINUATION:
+            msg_type = self.__msg_type
+        elif msg_type in (WSMsgType.TEXT, WSMsgType.BINARY):
+            self.__msg_type = msg_type
+
+        if msg_type == WSMsgType.TEXT:
+            # Frame payload is only valid during this callback, copy it
+            self.__fragments.append(frame.get_payload_as_bytes())
+
+            if frame.fin:
+                self.__messages.put_nowait(b"".join(self.__fragments))
+                self.__fragments.clear()
+        elif msg_type == WSMsgType.CLOSE:
+            transport.send_close(frame.get_close_code(), frame.get_close_message())
+            transport.disconnect()
+
+    def on_ws_disconnected(self, transport: WSTransport) -> None:
+        # Tell receive_message to stop
+        self.__messages.put_nowait(None)
+
+
+class JanusTransportPicows(JanusTransport):
+    """Janus transport through Websocket, using picows
+
+    Select it with config={"engine": "picows"} in JanusTransport.create_transport.
+    """
+
+    engine = "picows"
+
+    ws: WSTransport
+    subprotocol: str
+    connected: bool
+    receive_message_task: asyncio.Task
+    __messages: asyncio.Queue
+
+    def __init__(self, **kwargs: dict):
+        super().__init__(**kwargs)
+
+        self.connected = False
+        self.receive_message_task = None
+        self.__messages = asyncio.Queue()
+
+        if "subprotocol" in kwargs:
+            self.subprotocol = kwargs["subprotocol"]
+        else:
+            self.subprotocol = "janus-protocol"
+
+    async def _connect(self, **kwargs: dict) -> None:
+        """Connect to server
+
+        All extra keyword arguments will be passed to picows.ws_connect
+        """
+
+        logger.info(f"Connecting to: {self.base_url}")
+
+        self.ws, _ = await ws_connect(
+            lambda: JanusPicowsListener(self.__messages),
+            self.base_url,
+            extra_headers={"Sec-WebSocket-Protocol": self.subprotocol},
+            **kwargs,
+        )
+        self.receive_message_task = asyncio.create_task(self.receive_message())
+        self.receive_message_task.add_done_callback(self.receive_message_done_cb)
+
+        self.connected = True
+        logger.info("Connected")
+
+    async def _disconnect(self) -> None:
+        logger.info("Disconnecting")
+        self.ws.send_close(WSCloseCode.OK)
+        self.ws.disconnect()
+        await self.ws.wait_disconnected()
+        await asyncio.wait([self.receive_message_task])
+        self.connected = False
+        logger.info("Disconnected")
+
+    def receive_message_done_cb(self, task: asyncio.Task, context=None) -> None:
+        try:
+            # Check if any exceptions are raised
+            exception = task.exception()
+            if exception:
+                logger.error(
+                    "".join(
+                        traceback.format_exception(
+                            type(exception),
+                            value=exception,
+                            tb=exception.__traceback__,
+                        )
+                    )
+                )
+        except asyncio.CancelledError:
+            logger.info("Receive message task ended")
+        except asyncio.InvalidStateError:
+            logger.info("receive_message_done_cb called with invalid state")
+
+        self.connected = False
+
+    async def receive_message(self) -> None:
+        while True:
+            message_raw: Union[bytes, None] = await self.__messages.get()
+            if message_raw is None:
+                # Disconnected
+                break
+
+            await self.receive(await json_loads_async(message_raw))
+
+    async def _send(
+        self,
+        message: dict,
+    ) -> None:
+        if not self.connected:
+            raise Exception("Must connect before any communication.")
+
+        # Only copies into the write buffer, doesn't need to be awaited
+        self.ws.send(WSMsgType.TEXT, json_dumps_bytes(message))
+
+
+def protocol_matcher(base_url: str):
+    return base_url.startswith(("ws://", "wss://"))
+
+
+JanusTransport.register_transport(
+    protocol_matcher=protocol_matcher, transport_cls=JanusTransportPicows
+)
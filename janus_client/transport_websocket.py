@@ -1,12 +1,11 @@
 import logging
 from typing import Any
 import asyncio
-import json
 import traceback
 
 import websockets
 
-from .transport import JanusTransport
+from .transport import JanusTransport, json_dumps, json_loads_async
 
 
 logger = logging.getLogger(__name__)
@@ -98,9 +97,7 @@ class JanusTransportWebsocket(JanusTransport):
             raise Exception("Not connected to server.")
 
         async for message_raw in self.ws:
-            response = json.loads(message_raw)
-
-            await self.receive(response)
+            await self.receive(await json_loads_async(message_raw))
 
     async def _send(
         self,
@@ -112,7 +109,7 @@ class JanusTransportWebsocket(JanusTransport):
         if not self.receiving_message:
             raise Exception("Websocket not receiving message")
 
-        await self.ws.send(json.dumps(message))
+        await self.ws.send(json_dumps(message))
 
 
 def protocol_matcher(base_url: str):
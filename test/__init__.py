@@ -0,0 +1,10 @@
+import asyncio
+import sys
+
+# The default proactor event loop on Windows warns about transports that
+# aiohttp closes after the loop is gone:
+# "Exception ignored in: <function _ProactorBasePipeTransport.__del__ ...>"
+# The selector event loop doesn't have this problem, so tests don't need to
+# sleep after disconnecting.
+if sys.platform == "win32":
+    asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
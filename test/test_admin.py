@@ -1,9 +1,7 @@
 import unittest
 import logging
-import asyncio
 
 from janus_client import JanusAdminMonitorClient
-from test.util import async_test
 
 format = "%(asctime)s: %(message)s"
 logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
@@ -11,7 +9,7 @@ logger = logging.getLogger()
 
 
 class BaseTestClass:
-    class TestClass(unittest.TestCase):
+    class TestClass(unittest.IsolatedAsyncioTestCase):
         server_url: str
         admin_secret: str
 
@@ -24,52 +22,26 @@ class BaseTestClass:
 
         async def asyncTearDown(self) -> None:
             await self.admin_client.disconnect()
-            # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
-            # Working around to avoid "Exception ignored in: <function _ProactorBasePipeTransport.__del__ at 0x0000024A04C60280>"
-            await asyncio.sleep(0.250)
 
-        @async_test
         async def test_sanity(self):
-            await self.asyncSetUp()
-
             response = await self.admin_client.ping()
             self.assertEqual(response["janus"], "pong")
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_info(self):
-            await self.asyncSetUp()
-
             response = await self.admin_client.info()
             self.assertEqual(response["janus"], "server_info")
             self.assertEqual(response["name"], "Janus WebRTC Server")
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_loops_info(self):
-            await self.asyncSetUp()
-
             response = await self.admin_client.loops_info()
             self.assertListEqual(response, [])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_get_settings(self):
-            await self.asyncSetUp()
-
             response = await self.admin_client.get_settings()
             # Need to make sure this doesn't change on test server
             self.assertEqual(response["log_colors"], False)
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_session_timeout(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -83,12 +55,7 @@ class BaseTestClass:
             )
             self.assertEqual(response, settings["session_timeout"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_log_level(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -98,12 +65,7 @@ class BaseTestClass:
             response = await self.admin_client.set_log_level(settings["log_level"])
             self.assertEqual(response, settings["log_level"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_log_timestamps(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -117,12 +79,7 @@ class BaseTestClass:
             )
             self.assertEqual(response, settings["log_timestamps"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_log_colors(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -134,12 +91,7 @@ class BaseTestClass:
             response = await self.admin_client.set_log_colors(settings["log_colors"])
             self.assertEqual(response, settings["log_colors"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_locking_debug(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -153,12 +105,7 @@ class BaseTestClass:
             )
             self.assertEqual(response, settings["locking_debug"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_refcount_debug(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -172,12 +119,7 @@ class BaseTestClass:
             )
             self.assertEqual(response, settings["refcount_debug"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_libnice_debug(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -191,12 +133,7 @@ class BaseTestClass:
             )
             self.assertEqual(response, settings["libnice_debug"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_min_nack_queue(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -210,12 +147,7 @@ class BaseTestClass:
             )
             self.assertEqual(response, settings["min_nack_queue"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_no_media_timer(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -229,12 +161,7 @@ class BaseTestClass:
             )
             self.assertEqual(response, settings["no_media_timer"])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_set_slowlink_threshold(self):
-            await self.asyncSetUp()
-
             settings = await self.admin_client.get_settings()
             self.assertEqual(settings["log_colors"], False)
 
@@ -248,21 +175,42 @@ class BaseTestClass:
             )
             self.assertEqual(response, settings["slowlink_threshold"])
 
-            await self.asyncTearDown()
+        async def test_set_settings(self):
+            settings = await self.admin_client.get_settings()
+            self.assertEqual(settings["log_colors"], False)
 
-        @async_test
-        async def test_list_tokens(self):
-            await self.asyncSetUp()
+            response = await self.admin_client.set_settings(
+                log_level=settings["log_level"] + 1,
+                min_nack_queue=settings["min_nack_queue"] + 1,
+            )
+            self.assertDictEqual(
+                response,
+                {
+                    "log_level": settings["log_level"] + 1,
+                    "min_nack_queue": settings["min_nack_queue"] + 1,
+                },
+            )
 
+            response = await self.admin_client.set_settings(
+                log_level=settings["log_level"],
+                min_nack_queue=settings["min_nack_queue"],
+            )
+            self.assertDictEqual(
+                response,
+                {
+                    "log_level": settings["log_level"],
+                    "min_nack_queue": settings["min_nack_queue"],
+                },
+            )
+
+            with self.assertRaises(TypeError):
+                await self.admin_client.set_settings(not_a_setting=1)
+
+        async def test_list_tokens(self):
             tokens = await self.admin_client.list_tokens()
             self.assertListEqual(tokens, [])
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_add_and_remove_token(self):
-            await self.asyncSetUp()
-
             tokens = await self.admin_client.list_tokens()
             self.assertListEqual(tokens, [])
 
@@ -274,12 +222,7 @@ class BaseTestClass:
             response = await self.admin_client.remove_token(token=token_test)
             self.assertTrue(response)
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_allow_token(self):
-            await self.asyncSetUp()
-
             tokens = await self.admin_client.list_tokens()
             self.assertListEqual(tokens, [])
 
@@ -300,12 +243,7 @@ class BaseTestClass:
             response = await self.admin_client.remove_token(token=token_test)
             self.assertTrue(response)
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_disallow_token(self):
-            await self.asyncSetUp()
-
             tokens = await self.admin_client.list_tokens()
             self.assertListEqual(tokens, [])
 
@@ -354,8 +292,6 @@ class BaseTestClass:
             response = await self.admin_client.remove_token(token=token_test)
             self.assertTrue(response)
 
-            await self.asyncTearDown()
-
 
 class TestTransportHttps(BaseTestClass.TestClass):
     server_url = "https://janusmy.josephgetmyip.com/janusadminbase/admin"
@@ -0,0 +1,355 @@
+import asyncio
+import copy
+import gc
+import unittest
+from unittest import mock
+import logging
+
+from janus_client import JanusAdminMonitorClient
+from janus_client.message_transaction import CompiledMatcher
+from test.util import FakeJanusAdmin
+
+format = "%(asctime)s: %(message)s"
+logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
+logger = logging.getLogger()
+
+
+class TestAdminCache(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = FakeJanusAdmin()
+        await self.server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.admin_client.disconnect()
+        await self.server.stop()
+
+    async def connect(self, **kwargs) -> None:
+        self.admin_client = JanusAdminMonitorClient(
+            base_url=self.server.url, admin_secret="secret", **kwargs
+        )
+        await self.admin_client.connect()
+
+    async def test_cached(self):
+        await self.connect()
+
+        await self.admin_client.get_settings()
+        settings = await self.admin_client.get_settings()
+        self.assertEqual(settings["log_level"], 4)
+        self.assertEqual(self.server.count("get_status"), 1)
+
+    async def test_ttl(self):
+        await self.connect(admin_cache_ttl=0.05)
+
+        await self.admin_client.get_settings()
+        await asyncio.sleep(0.1)
+        await self.admin_client.get_settings()
+        self.assertEqual(self.server.count("get_status"), 2)
+
+    async def test_disabled(self):
+        await self.connect(admin_cache_ttl=0)
+
+        await self.admin_client.get_settings()
+        await self.admin_client.get_settings()
+        self.assertEqual(self.server.count("get_status"), 2)
+
+    async def test_copy(self):
+        await self.connect()
+
+        settings = await self.admin_client.get_settings()
+        settings["log_level"] = 0
+        settings = await self.admin_client.get_settings()
+        settings["log_level"] = 1
+        settings = await self.admin_client.get_settings()
+        self.assertDictEqual(settings, {"log_level": 4, "log_colors": False})
+
+    async def test_one_copy_per_call(self):
+        await self.connect()
+
+        with mock.patch.object(copy, "deepcopy", wraps=copy.deepcopy) as deepcopy:
+            # Stored copy
+            await self.admin_client.get_settings()
+            self.assertEqual(deepcopy.call_count, 1)
+
+            # Returned copy
+            await self.admin_client.get_settings()
+            self.assertEqual(deepcopy.call_count, 2)
+
+    async def test_missing_janus(self):
+        await self.connect()
+
+        with self.assertRaisesRegex(Exception, 'Must set "janus" field'):
+            await self.admin_client.send_wrapper(message={"level": 1})
+
+    async def test_write_clears(self):
+        await self.connect()
+
+        await self.admin_client.get_settings()
+        await self.admin_client.set_log_level(5)
+        settings = await self.admin_client.get_settings()
+        self.assertEqual(settings["log_level"], 5)
+
+    async def test_failed_write_clears(self):
+        await self.connect()
+        self.server.silent.add("set_log_level")
+
+        await self.admin_client.get_settings()
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.admin_client.send_wrapper(
+                message={"janus": "set_log_level", "level": 5},
+                timeout=0.1,
+            )
+        settings = await self.admin_client.get_settings()
+        self.assertEqual(settings["log_level"], 5)
+
+    async def test_write_during_read(self):
+        await self.connect()
+        self.server.delays["get_status"] = 0.2
+
+        # Answered with the settings from before the write
+        read = asyncio.ensure_future(self.admin_client.get_settings())
+        await asyncio.sleep(0.05)
+        await self.admin_client.set_log_level(5)
+        settings = await read
+        self.assertEqual(settings["log_level"], 4)
+
+        settings = await self.admin_client.get_settings()
+        self.assertEqual(settings["log_level"], 5)
+        self.assertEqual(self.server.count("get_status"), 2)
+
+
+class TestAdminInflight(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = FakeJanusAdmin()
+        await self.server.start()
+        self.admin_client = JanusAdminMonitorClient(
+            base_url=self.server.url, admin_secret="secret", admin_max_inflight=1
+        )
+        await self.admin_client.connect()
+
+    async def asyncTearDown(self) -> None:
+        await self.admin_client.disconnect()
+        await self.server.stop()
+
+    async def test_timeout_includes_wait(self):
+        self.server.delays["get_status"] = 0.5
+
+        read = asyncio.ensure_future(self.admin_client.get_settings())
+        await asyncio.sleep(0.05)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        with self.assertRaises(asyncio.TimeoutError):
+            await self.admin_client.send_wrapper(
+                message={"janus": "ping"}, authorize=False, timeout=0.1
+            )
+        self.assertLess(loop.time() - start, 0.4)
+        self.assertEqual(self.server.count("ping"), 0)
+
+        await read
+        response = await self.admin_client.ping()
+        self.assertEqual(response["janus"], "pong")
+
+    async def test_free_slot(self):
+        with mock.patch.object(asyncio, "wait_for", wraps=asyncio.wait_for) as wait_for:
+            await self.admin_client.ping()
+
+        # Only the one waiting for the response
+        self.assertEqual(wait_for.call_count, 1)
+
+    async def test_invalid(self):
+        with self.assertRaises(ValueError):
+            JanusAdminMonitorClient(
+                base_url=self.server.url, admin_secret="secret", admin_max_inflight=0
+            )
+
+
+class TestAdminCoalesce(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = FakeJanusAdmin()
+        await self.server.start()
+        self.admin_client = JanusAdminMonitorClient(
+            base_url=self.server.url, admin_secret="secret", admin_cache_ttl=0
+        )
+        await self.admin_client.connect()
+        self.server.delays["get_status"] = 0.2
+
+    async def asyncTearDown(self) -> None:
+        await self.admin_client.disconnect()
+        await self.server.stop()
+
+    async def test_one_request(self):
+        responses = await asyncio.gather(
+            *[self.admin_client.get_settings() for _ in range(5)]
+        )
+        self.assertEqual(self.server.count("get_status"), 1)
+        for response in responses:
+            self.assertDictEqual(response, {"log_level": 4, "log_colors": False})
+        self.assertIsNot(responses[0], responses[1])
+
+    async def test_copy_only_for_joiners(self):
+        with mock.patch.object(copy, "deepcopy", wraps=copy.deepcopy) as deepcopy:
+            await self.admin_client.send_wrapper(message={"janus": "get_status"})
+            self.assertEqual(deepcopy.call_count, 0)
+
+            await asyncio.gather(*[self.admin_client.get_settings() for _ in range(3)])
+            self.assertEqual(deepcopy.call_count, 2)
+
+    async def test_timeout(self):
+        message = {"janus": "get_status"}
+        matcher = CompiledMatcher({"janus": "success"})
+        short, unlimited = await asyncio.gather(
+            self.admin_client.send_wrapper(
+                message=message, matcher=matcher, timeout=0.1
+            ),
+            self.admin_client.send_wrapper(
+                message=message, matcher=matcher, timeout=None
+            ),
+            return_exceptions=True,
+        )
+        self.assertIsInstance(short, asyncio.TimeoutError)
+        self.assertEqual(unlimited["janus"], "success")
+        self.assertEqual(self.server.count("get_status"), 2)
+
+    async def test_not_across_writes(self):
+        before = asyncio.ensure_future(self.admin_client.get_settings())
+        await asyncio.sleep(0.05)
+        await self.admin_client.set_log_level(5)
+        after = await self.admin_client.get_settings()
+
+        self.assertEqual((await before)["log_level"], 4)
+        self.assertEqual(after["log_level"], 5)
+
+    async def test_cancelled(self):
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+        self.server.silent.add("get_status")
+
+        read = asyncio.ensure_future(
+            self.admin_client.send_wrapper(message={"janus": "get_status"}, timeout=0.1)
+        )
+        await asyncio.sleep(0.05)
+        read.cancel()
+        await asyncio.sleep(0.2)
+
+        gc.collect()
+        self.assertListEqual(errors, [])
+
+
+class TestAdminConnections(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = FakeJanusAdmin()
+        await self.server.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.server.stop()
+
+    async def test_spread(self):
+        admin_client = JanusAdminMonitorClient(
+            base_url=self.server.url, admin_secret="secret", admin_connections=3
+        )
+        await admin_client.connect()
+
+        for _ in range(6):
+            await admin_client.ping()
+        self.assertListEqual(
+            [len(requests) for requests in self.server.connections], [2, 2, 2]
+        )
+
+        await admin_client.disconnect()
+
+    async def test_info_takes_one_turn(self):
+        admin_client = JanusAdminMonitorClient(
+            base_url=self.server.url, admin_secret="secret", admin_connections=2
+        )
+        await admin_client.connect()
+
+        await admin_client.ping()
+        await admin_client.info()
+        await admin_client.ping()
+        self.assertCountEqual(
+            [
+                [request["janus"] for request in requests]
+                for requests in self.server.connections
+            ],
+            [["ping", "ping"], ["info"]],
+        )
+
+        await admin_client.disconnect()
+
+    async def test_invalid(self):
+        with self.assertRaises(ValueError):
+            JanusAdminMonitorClient(
+                base_url=self.server.url, admin_secret="secret", admin_connections=0
+            )
+
+
+class TestAdminTokens(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = FakeJanusAdmin()
+        await self.server.start()
+        self.admin_client = JanusAdminMonitorClient(
+            base_url=self.server.url, admin_secret="secret"
+        )
+        await self.admin_client.connect()
+
+    async def asyncTearDown(self) -> None:
+        await self.admin_client.disconnect()
+        await self.server.stop()
+
+    async def test_generated_tokens(self):
+        token_1 = await self.admin_client.add_token()
+        token_2 = await self.admin_client.add_token()
+        self.assertNotEqual(token_1, token_2)
+        self.assertCountEqual(self.server.tokens.keys(), [token_1, token_2])
+
+        self.assertTrue(await self.admin_client.remove_token(token=token_1))
+        self.assertTrue(await self.admin_client.remove_token(token=token_2))
+        self.assertDictEqual(self.server.tokens, {})
+
+
+class TestAdminSettings(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.server = FakeJanusAdmin()
+        await self.server.start()
+        self.admin_client = JanusAdminMonitorClient(
+            base_url=self.server.url, admin_secret="secret"
+        )
+        await self.admin_client.connect()
+
+    async def asyncTearDown(self) -> None:
+        await self.admin_client.disconnect()
+        await self.server.stop()
+
+    async def test_set_settings(self):
+        # Answer the first requests last
+        self.server.delays["set_log_level"] = 0.1
+        self.server.delays["set_session_timeout"] = 0.05
+
+        settings = {
+            "log_level": 5,
+            "session_timeout": 30,
+            "log_colors": True,
+            "locking_debug": False,
+            "refcount_debug": True,
+            "min_nack_queue": 300,
+        }
+        response = await self.admin_client.set_settings(**settings)
+        self.assertDictEqual(response, settings)
+        self.assertListEqual(list(response), list(settings))
+
+        self.assertEqual(len(self.server.requests), len(settings))
+        settings_now = await self.admin_client.get_settings()
+        self.assertDictEqual(settings_now, settings)
+
+    async def test_message_unchanged(self):
+        message = {"janus": "set_log_level", "level": 5}
+
+        for _ in range(2):
+            await self.admin_client.send_wrapper(message=message)
+        self.assertDictEqual(message, {"janus": "set_log_level", "level": 5})
+
+        first, second = self.server.requests
+        self.assertEqual(first["admin_secret"], "secret")
+        self.assertNotEqual(first["transaction"], second["transaction"])
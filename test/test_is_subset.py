@@ -1,7 +1,7 @@
 import unittest
 import logging
 
-from janus_client.message_transaction import is_subset
+from janus_client.message_transaction import is_subset, CompiledMatcher
 
 format = "%(asctime)s: %(message)s"
 logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
@@ -65,3 +65,49 @@ class TestClass(unittest.TestCase):
                 dict_2={"a": 1, "b": {"e": {"f": None, "g": None}}},
             )
         )
+
+
+class TestCompiledMatcher(unittest.TestCase):
+    def assertSameAsIsSubset(self, dict_1: dict, dict_2: dict):
+        self.assertEqual(CompiledMatcher(dict_2)(dict_1), is_subset(dict_1, dict_2))
+
+    def test_sanity(self):
+        self.assertTrue(CompiledMatcher({"a": 1})({"a": 1}))
+        self.assertFalse(CompiledMatcher({"a": 1})({"a": 2}))
+
+    def test_empty_dict(self):
+        self.assertTrue(CompiledMatcher({})({"a": 1}))
+        self.assertTrue(CompiledMatcher({})({}))
+        self.assertFalse(CompiledMatcher({"a": 1})({}))
+
+    def test_invalid_input(self):
+        self.assertRaises(TypeError, CompiledMatcher, "")
+
+    def test_same_as_is_subset(self):
+        messages = [
+            {},
+            {"a": 1, "b": None},
+            {"a": 1, "b": 2},
+            {"a": 1, "b": "2"},
+            {"a": 1, "b": {"c": 2, "d": 3, "e": {"f": 4}}},
+            {"a": 1, "b": {"e": "f"}},
+        ]
+        matchers = [
+            {},
+            {"a": 1},
+            {"b": None},
+            {"b": 3},
+            {"b": "2"},
+            {"c": None},
+            {"b": {}},
+            {"a": 1, "b": {"c": 2}},
+            {"a": 1, "b": {"e": {}}},
+            {"a": 1, "b": {"c": None, "e": {}}},
+            {"a": 1, "b": {"e": None}},
+            {"a": 1, "b": {"e": {"f": None}}},
+            {"a": 1, "b": {"e": {"f": None, "g": None}}},
+        ]
+        for message in messages:
+            for matcher in matchers:
+                with self.subTest(message=message, matcher=matcher):
+                    self.assertSameAsIsSubset(dict_1=message, dict_2=matcher)
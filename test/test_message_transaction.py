@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+
+from janus_client.message_transaction import MessageTransaction
+
+
+class TestMessageTransaction(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.transaction = MessageTransaction()
+
+    async def put_messages(self, message: dict, interval: float) -> None:
+        while True:
+            self.transaction.put_msg(message)
+            await asyncio.sleep(interval)
+
+    async def test_match(self):
+        self.transaction.put_msg({"janus": "ack"})
+        self.transaction.put_msg({"janus": "success"})
+
+        response = await self.transaction.get({"janus": "success"}, timeout=0.1)
+        self.assertDictEqual(response, {"janus": "success"})
+
+        # Earlier messages are kept
+        response = await self.transaction.get({"janus": "ack"}, timeout=0.1)
+        self.assertDictEqual(response, {"janus": "ack"})
+
+    async def test_timeout_covers_whole_wait(self):
+        # Non-matching messages keep arriving faster than the timeout
+        put_messages = asyncio.ensure_future(self.put_messages({"janus": "ack"}, 0.01))
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            with self.assertRaises(asyncio.TimeoutError):
+                # Outer timeout so a per message timeout fails instead of hanging
+                await asyncio.wait_for(
+                    self.transaction.get({"janus": "success"}, timeout=0.1), 1
+                )
+        finally:
+            put_messages.cancel()
+
+        self.assertLess(loop.time() - start, 0.3)
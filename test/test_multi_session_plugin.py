@@ -24,9 +24,6 @@ class BaseTestClass:
 
         async def asyncTearDown(self) -> None:
             await self.transport.disconnect()
-            # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
-            # Working around to avoid "Exception ignored in: <function _ProactorBasePipeTransport.__del__ at 0x0000024A04C60280>"
-            await asyncio.sleep(0.250)
 
         @async_test
         async def test_0_1_1(self):
@@ -11,7 +11,6 @@ from janus_client import (
     JanusVideoRoomPlugin,
     MediaPlayer,
 )
-from test.util import async_test
 
 format = "%(asctime)s: %(message)s"
 logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
@@ -19,7 +18,7 @@ logger = logging.getLogger()
 
 
 class BaseTestClass:
-    class TestClass(unittest.TestCase):
+    class TestClass(unittest.IsolatedAsyncioTestCase):
         server_url: str
 
         async def asyncSetUp(self) -> None:
@@ -30,14 +29,8 @@ class BaseTestClass:
 
         async def asyncTearDown(self) -> None:
             await self.transport.disconnect()
-            # https://docs.aiohttp.org/en/stable/client_advanced.html#graceful-shutdown
-            # Working around to avoid "Exception ignored in: <function _ProactorBasePipeTransport.__del__ at 0x0000024A04C60280>"
-            await asyncio.sleep(0.250)
 
-        @async_test
         async def test_create_edit_destroy(self):
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin = JanusVideoRoomPlugin()
@@ -63,12 +56,7 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_exists(self):
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin = JanusVideoRoomPlugin()
@@ -94,16 +82,11 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_allowed(self):
             """Test "allowed" API.
 
             This is a dummy test to increase coverage.
             """
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin = JanusVideoRoomPlugin()
@@ -123,13 +106,8 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_kick(self):
             """Test "kick" API."""
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin = JanusVideoRoomPlugin()
@@ -149,13 +127,8 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_moderate(self):
             """Test "kick" API."""
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin = JanusVideoRoomPlugin()
@@ -177,13 +150,8 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_list_room(self):
             """Test "list" API."""
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin = JanusVideoRoomPlugin()
@@ -205,13 +173,8 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_list_participants(self):
             """Test "listparticipants" API."""
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin = JanusVideoRoomPlugin()
@@ -231,13 +194,8 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_join_and_leave(self):
             """Test "join" API."""
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin = JanusVideoRoomPlugin()
@@ -260,14 +218,9 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_publish_and_unpublish(self):
             """Test publish and then unpublish media."""
 
-            await self.asyncSetUp()
-
             async with JanusSession(transport=self.transport) as session:
                 plugin = JanusVideoRoomPlugin()
 
@@ -309,13 +262,8 @@ class BaseTestClass:
                 # Don't need to destroy if using context manager, but still good to do it
                 await session.destroy()
 
-            await self.asyncTearDown()
-
-        @async_test
         async def test_publish_and_subscribe(self):
             """Test publish and then subscribe to the same media."""
-            await self.asyncSetUp()
-
             session = JanusSession(transport=self.transport)
 
             plugin_publish = JanusVideoRoomPlugin()
@@ -398,8 +346,6 @@ class BaseTestClass:
 
             await session.destroy()
 
-            await self.asyncTearDown()
-
 
 class TestTransportHttps(BaseTestClass.TestClass):
     server_url = "https://janusmy.josephgetmyip.com/janusbase/janus"
@@ -0,0 +1,69 @@
+import json
+import unittest
+import logging
+
+from janus_client import JanusAdminMonitorClient
+from test.util import FakeJanusAdmin
+
+try:
+    from janus_client import JanusTransportPicows
+except ImportError:
+    JanusTransportPicows = None
+
+format = "%(asctime)s: %(message)s"
+logging.basicConfig(format=format, level=logging.INFO, datefmt="%H:%M:%S")
+logger = logging.getLogger()
+
+
+class FakeJanusAdminFragmented(FakeJanusAdmin):
+    """Send a fragmented binary message before each fragmented response"""
+
+    async def reply(self, websocket, response: dict, delay: float) -> None:
+        await websocket.send([b"\x00\x01", b"\x02\x03"])
+
+        text = json.dumps(response)
+        await websocket.send([text[:10], text[10:20], text[20:]])
+
+
+@unittest.skipIf(JanusTransportPicows is None, "picows is not installed")
+class TestTransportPicows(unittest.IsolatedAsyncioTestCase):
+    server_cls = FakeJanusAdmin
+
+    async def asyncSetUp(self) -> None:
+        self.server = self.server_cls()
+        await self.server.start()
+        self.admin_client = JanusAdminMonitorClient(
+            base_url=self.server.url,
+            admin_secret="secret",
+            admin_cache_ttl=0,
+            transport_config={"engine": "picows"},
+        )
+        await self.admin_client.connect()
+
+    async def asyncTearDown(self) -> None:
+        await self.admin_client.disconnect()
+        await self.server.stop()
+
+    async def test_sanity(self):
+        self.assertIsInstance(
+            self.admin_client._JanusAdminMonitorClient__transports[0],
+            JanusTransportPicows,
+        )
+
+        response = await self.admin_client.ping()
+        self.assertEqual(response["janus"], "pong")
+
+    async def test_large_message(self):
+        self.server.settings["big"] = "x" * 100000
+
+        settings = await self.admin_client.get_settings()
+        self.assertEqual(settings["big"], "x" * 100000)
+
+
+class TestTransportPicowsFragmented(TestTransportPicows):
+    server_cls = FakeJanusAdminFragmented
+
+    async def test_fragmented(self):
+        for _ in range(2):
+            response = await self.admin_client.ping()
+            self.assertEqual(response["janus"], "pong")
@@ -1,4 +1,15 @@
 import asyncio
+import json
+from typing import Dict, List, Set
+
+import websockets
+
+from janus_client.admin_monitor import _SETTERS
+
+# Setting name and setter, keyed by request
+_SETTERS_BY_REQUEST = {
+    setter.request: (setting, setter) for setting, setter in _SETTERS.items()
+}
 
 
 def async_test(coro):
@@ -10,3 +21,91 @@ def async_test(coro):
             loop.close()
 
     return wrapper
+
+
+class FakeJanusAdmin:
+    """Local Websocket server that answers a few Janus admin requests
+
+    Records every request it gets in requests, and per connection in
+    connections. Responses are built when the request arrives and sent
+    after delays[janus] seconds. Requests listed in silent are applied but
+    never answered.
+    """
+
+    requests: List[dict]
+    settings: Dict
+    tokens: Dict[str, List[str]]
+    delays: Dict[str, float]
+    silent: Set[str]
+    connections: List[List[dict]]
+
+    def __init__(self) -> None:
+        self.requests = []
+        self.settings = {"log_level": 4, "log_colors": False}
+        self.tokens = dict()
+        self.delays = dict()
+        self.silent = set()
+        self.connections = []
+
+    async def start(self) -> None:
+        self.server = await websockets.serve(
+            self.handler, "127.0.0.1", 0, subprotocols=["janus-admin-protocol"]
+        )
+        port = self.server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}"
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    def count(self, janus: str) -> int:
+        return sum(1 for request in self.requests if request["janus"] == janus)
+
+    async def handler(self, websocket) -> None:
+        requests = []
+        self.connections.append(requests)
+        replies = set()
+        async for raw in websocket:
+            request = json.loads(raw)
+            self.requests.append(request)
+            requests.append(request)
+
+            response = self.respond(request)
+            if request["janus"] in self.silent:
+                continue
+
+            reply = asyncio.ensure_future(
+                self.reply(websocket, response, self.delays.get(request["janus"], 0))
+            )
+            replies.add(reply)
+            reply.add_done_callback(replies.discard)
+
+    def respond(self, request: dict) -> dict:
+        janus = request["janus"]
+        if janus == "ping":
+            response = {"janus": "pong"}
+        elif janus == "info":
+            response = {"janus": "server_info", "name": "Janus WebRTC Server"}
+        elif janus == "get_status":
+            response = {"janus": "success", "status": dict(self.settings)}
+        elif janus in _SETTERS_BY_REQUEST:
+            setting, setter = _SETTERS_BY_REQUEST[janus]
+            value = request[setter.field]
+            self.settings[setting] = value
+            response = {"janus": "success", setter.response_field: value}
+        elif janus == "add_token":
+            plugins = self.tokens.setdefault(request["token"], [])
+            plugins.extend(request.get("plugins", []))
+            response = {"janus": "success", "data": {"plugins": plugins}}
+        elif janus == "remove_token" and request["token"] in self.tokens:
+            del self.tokens[request["token"]]
+            response = {"janus": "success"}
+        else:
+            response = {"janus": "error", "error": {"code": 1, "reason": "Unknown"}}
+
+        response["transaction"] = request["transaction"]
+        return response
+
+    async def reply(self, websocket, response: dict, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await websocket.send(json.dumps(response))